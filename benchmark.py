@@ -2,12 +2,10 @@
 A quick way to asses the impact of certain changes.
 """
 
-from __future__ import absolute_import, division, print_function
-
 from characteristic import attributes
 
 
-class Artisanal(object):
+class Artisanal:
     def __init__(self, a, b, c):
         self.a = a
         self.b = b
@@ -15,12 +13,12 @@ class Artisanal(object):
 
 
 @attributes(["a", "b", "c"])
-class NoDefaults(object):
+class NoDefaults:
     pass
 
 
 @attributes(["a", "b", "c"], defaults={"c": 42})
-class Defaults(object):
+class Defaults:
     pass
 
 
@@ -41,11 +39,34 @@ def bench_both():
     Defaults(a=1, b=2)
 
 
+_one = NoDefaults(a=1, b=2, c=3)
+_other = NoDefaults(a=1, b=2, c=4)
+
+
+def bench_cmp():
+    _one == _other
+    _one < _other
+
+
+@attributes(["a", "b", "c", "d", "e", "f", "g", "h"])
+class Wide:
+    pass
+
+
+_wide_one = Wide(a=1, b=2, c=3, d=4, e=5, f=6, g=7, h=8)
+_wide_other = Wide(a=1, b=2, c=3, d=4, e=5, f=6, g=7, h=9)
+
+
+def bench_cmp_wide():
+    _wide_one == _wide_other
+    _wide_one < _wide_other
+
+
 if __name__ == "__main__":
     import timeit
 
     for func in ["bench_no_defaults", "bench_defaults", "bench_both",
-                 "bench_artisanal"]:
+                 "bench_artisanal", "bench_cmp", "bench_cmp_wide"]:
         print(
             func + ": ",
             timeit.timeit(func + "()",
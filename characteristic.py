@@ -2,12 +2,13 @@
 Python attributes without boilerplate.
 """
 
-from __future__ import absolute_import, division, print_function
-
+import copyreg
 import hashlib
+import keyword
 import linecache
 import sys
 import warnings
+import weakref
 
 
 __version__ = "15.0.0-dev"
@@ -26,18 +27,8 @@ __all__ = [
     "with_repr",
 ]
 
-PY26 = sys.version_info[0:2] == (2, 6)
-
-# I'm sorry. :(
-if sys.version_info[0] == 2:
-    def exec_(code, locals_, globals_):
-        exec("exec code in locals_, globals_")
-else:  # pragma: no cover
-    def exec_(code, locals_, globals_):
-        exec(code, locals_, globals_)
 
-
-class _Nothing(object):
+class _Nothing:
     """
     Sentinel class to indicate the lack of a value when ``None`` is ambiguous.
 
@@ -55,6 +46,22 @@ Sentinel to indicate the lack of a value when ``None`` is ambiguous.
 """
 
 
+_MISSING = object()
+"""
+Private sentinel for keyword arguments that haven't been passed to an
+initializer.
+"""
+
+
+def _intern(name):
+    """
+    Return the interned version of *name* if it's a :class:`str`.
+    """
+    if isinstance(name, str):
+        return sys.intern(name)
+    return name
+
+
 def strip_leading_underscores(attribute_name):
     """
     Strip leading underscores from *attribute_name*.
@@ -69,7 +76,7 @@ def strip_leading_underscores(attribute_name):
     return attribute_name.lstrip("_")
 
 
-class Attribute(object):
+class Attribute:
     """
     A representation of an attribute.
 
@@ -133,7 +140,7 @@ class Attribute(object):
     __slots__ = [
         "name", "exclude_from_cmp", "exclude_from_init", "exclude_from_repr",
         "exclude_from_immutable", "default_value", "default_factory",
-        "instance_of", "init_aliaser", "_kw_name",
+        "instance_of", "init_aliaser", "_kw_name", "__weakref__",
     ]
 
     def __init__(self,
@@ -155,7 +162,9 @@ class Attribute(object):
                 "ambiguous."
             )
 
-        self.name = name
+        # Interned names are used as keys by generated methods, thus make
+        # the lookups a pointer comparison.
+        self.name = _intern(name)
         self.exclude_from_cmp = exclude_from_cmp
         self.exclude_from_init = exclude_from_init
         self.exclude_from_repr = exclude_from_repr
@@ -167,9 +176,9 @@ class Attribute(object):
 
         self.init_aliaser = init_aliaser
         if init_aliaser is not None:
-            self._kw_name = init_aliaser(name)
+            self._kw_name = _intern(init_aliaser(name))
         else:
-            self._kw_name = name
+            self._kw_name = self.name
 
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
@@ -225,7 +234,9 @@ def _ensure_attributes(attrs, defaults):
 
     rv = []
     for attr in attrs:
-        if isinstance(attr, Attribute):
+        # Checking the exact type first saves walking the MRO in the common
+        # case.
+        if type(attr) is Attribute or isinstance(attr, Attribute):
             if defaults != {}:
                 raise ValueError(
                     "Mixing of the 'defaults' keyword argument and passing "
@@ -235,18 +246,39 @@ def _ensure_attributes(attrs, defaults):
                 )
             else:
                 rv.append(attr)
-        else:
+        elif attr in defaults:
             rv.append(
                 Attribute(
                     attr,
                     init_aliaser=None,
-                    default_value=defaults.get(attr, NOTHING)
+                    default_value=defaults[attr]
                 )
             )
+        else:
+            rv.append(_plain_attribute(attr))
 
     return rv
 
 
+_PLAIN_ATTRIBUTES = weakref.WeakValueDictionary()
+"""
+Cache of :class:`Attribute` instances for plain names that are still in use.
+"""
+
+
+def _plain_attribute(name):
+    """
+    Return an :class:`Attribute` for *name* without any further settings.
+
+    Since attributes are read-only, the same instance is shared between all
+    classes that use *name* as a plain attribute.
+    """
+    attr = _PLAIN_ATTRIBUTES.get(name)
+    if attr is None:
+        attr = _PLAIN_ATTRIBUTES[name] = Attribute(name, init_aliaser=None)
+    return attr
+
+
 def with_cmp(attrs):
     """
     A class decorator that adds comparison methods and a hashing method based
@@ -260,87 +292,24 @@ def with_cmp(attrs):
     :param attrs: Attributes to work with.
     :type attrs: :class:`list` of :class:`str` or :class:`Attribute`\ s.
     """
-    def attrs_to_tuple(obj):
-        """
-        Create a tuple of all values of *obj*'s *attrs*.
-        """
-        return tuple(getattr(obj, a.name) for a in attrs)
+    return _with_cmp(_ensure_attributes(attrs, NOTHING))
 
-    def eq(self, other):
-        """
-        Automatically created by characteristic.
-        """
-        if other.__class__ is self.__class__:
-            return attrs_to_tuple(self) == attrs_to_tuple(other)
-        else:
-            return NotImplemented
 
-    def ne(self, other):
-        """
-        Automatically created by characteristic.
-        """
-        result = eq(self, other)
-        if result is NotImplemented:
-            return NotImplemented
-        else:
-            return not result
-
-    def lt(self, other):
-        """
-        Automatically created by characteristic.
-        """
-        if other.__class__ is self.__class__:
-            return attrs_to_tuple(self) < attrs_to_tuple(other)
-        else:
-            return NotImplemented
-
-    def le(self, other):
-        """
-        Automatically created by characteristic.
-        """
-        if other.__class__ is self.__class__:
-            return attrs_to_tuple(self) <= attrs_to_tuple(other)
-        else:
-            return NotImplemented
-
-    def gt(self, other):
-        """
-        Automatically created by characteristic.
-        """
-        if other.__class__ is self.__class__:
-            return attrs_to_tuple(self) > attrs_to_tuple(other)
-        else:
-            return NotImplemented
-
-    def ge(self, other):
-        """
-        Automatically created by characteristic.
-        """
-        if other.__class__ is self.__class__:
-            return attrs_to_tuple(self) >= attrs_to_tuple(other)
-        else:
-            return NotImplemented
-
-    def hash_(self):
-        """
-        Automatically created by characteristic.
-        """
-        return hash(attrs_to_tuple(self))
+def _with_cmp(attrs):
+    """
+    Implementation of :func:`with_cmp` for a list of :class:`Attribute`
+    instances.
+    """
+    attrs = [a for a in attrs if a.exclude_from_cmp is False]
+    methods = _compile_script("cmp", attrs, _attrs_to_cmp_script(attrs), {})
 
     def wrap(cl):
-        cl.__eq__ = eq
-        cl.__ne__ = ne
-        cl.__lt__ = lt
-        cl.__le__ = le
-        cl.__gt__ = gt
-        cl.__ge__ = ge
-        cl.__hash__ = hash_
+        for name, _ in _CMP_OPS:
+            setattr(cl, name, methods[name])
+        cl.__hash__ = methods["__hash__"]
 
         return cl
 
-    attrs = [a
-             for a in _ensure_attributes(attrs, NOTHING)
-             if a.exclude_from_cmp is False]
     return wrap
 
 
@@ -352,23 +321,20 @@ def with_repr(attrs):
     :param attrs: Attributes to work with.
     :type attrs: ``list`` of :class:`str` or :class:`Attribute`\ s.
     """
-    def repr_(self):
-        """
-        Automatically created by characteristic.
-        """
-        return "<{0}({1})>".format(
-            self.__class__.__name__,
-            ", ".join(a.name + "=" + repr(getattr(self, a.name))
-                      for a in attrs)
-        )
+    return _with_repr(_ensure_attributes(attrs, NOTHING))
+
+
+def _with_repr(attrs):
+    """
+    Implementation of :func:`with_repr` for a list of :class:`Attribute`
+    instances.
+    """
+    attrs = [a for a in attrs if a.exclude_from_repr is False]
 
     def wrap(cl):
-        cl.__repr__ = repr_
+        cl.__repr__ = _lazy_repr(attrs)
         return cl
 
-    attrs = [a
-             for a in _ensure_attributes(attrs, NOTHING)
-             if a.exclude_from_repr is False]
     return wrap
 
 
@@ -401,82 +367,81 @@ def with_init(attrs, **kw):
     :param defaults: Default values if attributes are omitted on instantiation.
     :type defaults: ``dict`` or ``None``
     """
-    attrs = [attr
-             for attr in _ensure_attributes(attrs,
-                                            defaults=kw.get("defaults",
-                                                            NOTHING))
-             if attr.exclude_from_init is False]
-
-    # We cache the generated init methods for the same kinds of attributes.
-    sha1 = hashlib.sha1()
-    sha1.update(repr(attrs).encode("utf-8"))
-    unique_filename = "<characteristic generated init {0}>".format(
-        sha1.hexdigest()
+    return _with_init(
+        _ensure_attributes(attrs, defaults=kw.get("defaults", NOTHING))
     )
 
-    script = _attrs_to_script(attrs)
-    locs = {}
-    bytecode = compile(script, unique_filename, "exec")
-    exec_(bytecode, {"NOTHING": NOTHING, "attrs": attrs}, locs)
-    init = locs["characteristic_init"]
+
+def _with_init(attrs):
+    """
+    Implementation of :func:`with_init` for a list of :class:`Attribute`
+    instances.
+    """
+    attrs = [a for a in attrs if a.exclude_from_init is False]
 
     def wrap(cl):
+        original_setattr = cl.__dict__.get("__original_setattr__")
+        globs = _attrs_to_globals(attrs)
+        if original_setattr is None:
+            script = _attrs_to_script(attrs)
+        else:
+            # immutable has been applied already.  Its sentry can be skipped
+            # since instances aren't frozen before they are initialized.
+            globs["_setattr"] = original_setattr
+            script = _attrs_to_script(attrs, bypass_setattr=True)
         cl.__original_init__ = cl.__init__
-        # In order of debuggers like PDB being able to step through the code,
-        # we add a fake linecache entry.
-        linecache.cache[unique_filename] = (
-            len(script),
-            None,
-            script.splitlines(True),
-            unique_filename
-        )
-        cl.__init__ = init
+        cl.__init__ = _compile_script(
+            "init", attrs, script, globs
+        )["characteristic_init"]
         return cl
 
     return wrap
 
 
-_VALID_INITS = frozenset(["characteristic_init", "__init__"])
-
-
 def immutable(attrs):
     """
     Class decorator that makes *attrs* of a class immutable.
 
-    That means that *attrs* can only be set from an initializer.  If anyone
-    else tries to set one of them, an :exc:`AttributeError` is raised.
+    That means that *attrs* can only be set until the initializer of the class
+    returns.  If anyone tries to set one of them afterwards, an
+    :exc:`AttributeError` is raised.
+
+    The instances are marked as initialized using an attribute called
+    ``__characteristic_frozen__`` that is part of their ``__dict__``,
+    therefore it has to be part of the ``__slots__`` if your class uses them.
 
     .. versionadded:: 14.0
+
+    .. versionchanged:: 15.0
+        Attributes may be set from anywhere -- including methods called by the
+        initializer -- until the initializer returns.  If the initializers of
+        several immutable classes are nested, the outermost one counts.
     """
-    # In this case, we just want to compare (native) strings.
-    attrs = frozenset(attr.name if isinstance(attr, Attribute) else attr
-                      for attr in _ensure_attributes(attrs, NOTHING)
-                      if attr.exclude_from_immutable is False)
+    return _immutable(_ensure_attributes(attrs, NOTHING))
 
-    def characteristic_immutability_sentry(self, attr, value):
-        """
-        Immutability sentry automatically created by characteristic.
 
-        If an attribute is attempted to be set from any other place than an
-        initializer, a TypeError is raised.  Else the original __setattr__ is
-        called.
-        """
-        prev = sys._getframe().f_back
-        if (
-            attr not in attrs
-            or
-            prev is not None and prev.f_code.co_name in _VALID_INITS
-        ):
-            self.__original_setattr__(attr, value)
-        else:
-            raise AttributeError(
-                "Attribute '{0}' of class '{1}' is immutable."
-                .format(attr, self.__class__.__name__)
-            )
+def _immutable(attrs):
+    """
+    Implementation of :func:`immutable` for a list of :class:`Attribute`
+    instances.
+    """
+    # In this case, we just want to compare (native) strings.
+    attrs = frozenset(a.name
+                      for a in attrs
+                      if a.exclude_from_immutable is False)
+    script = _FREEZING_INIT_SCRIPT + "\n" + _SENTRY_SCRIPT
 
     def wrap(cl):
+        methods = _compile_script("immutable", sorted(attrs), script, {
+            "_immutable_attrs": attrs,
+            "_original_init": cl.__init__,
+            "_setattr": cl.__setattr__,
+            "_init_nested": _init_nested,
+        })
         cl.__original_setattr__ = cl.__setattr__
-        cl.__setattr__ = characteristic_immutability_sentry
+        cl.__setattr__ = methods["characteristic_immutability_sentry"]
+        cl.__init__ = methods["characteristic_freezing_init"]
+        _FREEZING_INITS.add(cl.__init__)
         return cl
 
     return wrap
@@ -489,9 +454,80 @@ def _default_store_attributes(cls, attrs):
     cls.characteristic_attributes = attrs
 
 
+def _add_slots(cl, names):
+    """
+    Return a copy of *cl* that stores *names* in ``__slots__`` instead of a
+    per-instance ``__dict__``.
+
+    Names that are already slotted by *cl* or its bases are skipped and
+    ``__weakref__`` is added unless the instances support weak references
+    already.  Class variables that are named like one of *names* are removed.
+
+    :raises ValueError: If one of *names* is private and would therefore be
+        mangled.
+    """
+    for name in names:
+        if _is_private(name):
+            raise ValueError(
+                "Private attribute '{0}' can't be stored in __slots__ because "
+                "its name would be mangled.".format(name)
+            )
+
+    own_slots = _slot_names(cl)
+    base_slots = set()
+    has_weakref = "__weakref__" in own_slots
+    for base in cl.__mro__[1:]:
+        base_slots.update(_slot_names(base))
+        if "__weakref__" in base.__dict__:
+            has_weakref = True
+
+    slots = list(own_slots)
+    for name in names:
+        if name not in slots and name not in base_slots:
+            slots.append(name)
+    if has_weakref is False:
+        slots.append("__weakref__")
+
+    # The descriptors of the slots of *cl* are created again by the copy and
+    # class variables would conflict with the new slots.
+    skip = set(slots)
+    skip.update(("__dict__", "__weakref__"))
+    skip.update(
+        "_" + cl.__name__.lstrip("_") + name
+        for name in own_slots
+        if _is_private(name)
+    )
+    body = dict((k, v)
+                for k, v in cl.__dict__.items()
+                if k not in skip)
+    body["__slots__"] = tuple(slots)
+    qualname = getattr(cl, "__qualname__", None)
+    if qualname is not None:
+        body["__qualname__"] = qualname
+    return type(cl)(cl.__name__, cl.__bases__, body)
+
+
+def _is_private(name):
+    """
+    Return whether *name* is mangled if used within a class body.
+    """
+    return name.startswith("__") and not name.endswith("__")
+
+
+def _slot_names(cl):
+    """
+    Return the names that *cl* itself declares in its ``__slots__``.
+    """
+    slots = cl.__dict__.get("__slots__", ())
+    if isinstance(slots, str):
+        return (slots,)
+    return tuple(slots)
+
+
 def attributes(attrs, apply_with_cmp=True, apply_with_init=True,
                apply_with_repr=True, apply_immutable=False,
-               store_attributes=_default_store_attributes, **kw):
+               store_attributes=_default_store_attributes, use_slots=False,
+               **kw):
     """
     A convenience class decorator that allows to *selectively* apply
     :func:`with_cmp`, :func:`with_repr`, :func:`with_init`, and
@@ -510,7 +546,11 @@ def attributes(attrs, apply_with_cmp=True, apply_with_init=True,
     :type apply_with_repr: bool
 
     :param apply_immutable: Apply :func:`immutable`.  The only one that is off
-        by default.
+        by default.  Instances are marked as frozen using an attribute called
+        ``__characteristic_frozen__`` that is part of their ``__dict__``.  If
+        your class defines its own ``__slots__``, they have to contain it.  If
+        all attributes that are used by :func:`with_cmp` are immutable, the
+        hash of an instance is computed only once and cached on it.
     :type apply_immutable: bool
 
     :param store_attributes: Store the given ``attr``\ s on the class.
@@ -521,6 +561,17 @@ def attributes(attrs, apply_with_cmp=True, apply_with_init=True,
         a ``characteristic_attributes`` attribute on the class.
     :type store_attributes: callable
 
+    :param use_slots: Replace the class by a copy that stores *attrs* in
+        ``__slots__`` which makes instances smaller and attribute access
+        faster.  Since a new class is created, methods that use
+        argument-less ``super()`` won't work and no other instance
+        attributes can be set.  The latter only holds if all base classes use
+        ``__slots__`` too, though.  Existing ``__slots__`` of the class are
+        kept and extended while class variables that are named like one of
+        *attrs* are removed.  Private attributes (like ``__foo``) can't be
+        slotted and raise a :exc:`ValueError`.
+    :type use_slots: bool
+
     :raises ValueError: If both *defaults* and an instance of
         :class:`Attribute` has been passed.
 
@@ -533,6 +584,9 @@ def attributes(attrs, apply_with_cmp=True, apply_with_init=True,
     .. versionadded:: 14.2
         Added ``store_attributes``.
 
+    .. versionadded:: 15.0
+        Added ``use_slots``.
+
     .. deprecated:: 14.0
         Use :class:`Attribute` instead of ``defaults``.
 
@@ -564,109 +618,483 @@ def attributes(attrs, apply_with_cmp=True, apply_with_init=True,
             )
         )
 
+    # Hashes may only be cached if none of the hashed attributes can change.
+    cache_hash = apply_with_cmp is True and apply_immutable is True and all(
+        a.exclude_from_immutable is False
+        for a in attrs
+        if a.exclude_from_cmp is False
+    )
+
     def wrap(cl):
+        if use_slots is True:
+            names = [a.name for a in attrs]
+            if apply_immutable is True:
+                names.append("__characteristic_frozen__")
+                if cache_hash is True:
+                    names.append("__characteristic_hash__")
+            cl = _add_slots(cl, names)
         store_attributes(cl, attrs)
 
-        if apply_with_repr is True:
-            cl = with_repr(attrs)(cl)
-        if apply_with_cmp is True:
-            cl = with_cmp(attrs)(cl)
-        if apply_immutable is True:
-            cl = immutable(attrs)(cl)
-        if apply_with_init is True:
-            cl = with_init(attrs)(cl)
-        return cl
+        return _build_all(cl, attrs, apply_with_cmp, apply_with_init,
+                          apply_with_repr, apply_immutable, cache_hash)
     return wrap
 
 
-def _attrs_to_script(attrs):
+def _build_all(cl, attrs, apply_with_cmp, apply_with_init, apply_with_repr,
+               apply_immutable, cache_hash):
+    """
+    Add the methods of all applied decorators to *cl* at once.
+
+    All methods except ``__repr__`` are generated by a single script and call
+    the original ``__init__`` and ``__setattr__`` of *cl* directly.
+    ``__repr__`` is generated lazily on its first call.
+    """
+    scripts = []
+    globs = {
+        "_original_init": cl.__init__,
+        "_setattr": cl.__setattr__,
+    }
+    if apply_with_init is True:
+        init_attrs = [a for a in attrs if a.exclude_from_init is False]
+        scripts.append(_attrs_to_script(
+            init_attrs, bypass_setattr=apply_immutable, fused=True,
+            freeze=apply_immutable,
+        ))
+        globs.update(_attrs_to_globals(init_attrs))
+    elif apply_immutable is True:
+        scripts.append(_FREEZING_INIT_SCRIPT)
+    if apply_immutable is True:
+        scripts.append(_SENTRY_SCRIPT)
+        globs["_immutable_attrs"] = frozenset(
+            a.name for a in attrs if a.exclude_from_immutable is False
+        )
+        globs["_init_nested"] = _init_nested
+    if apply_with_cmp is True:
+        scripts.append(_attrs_to_cmp_script(
+            [a for a in attrs if a.exclude_from_cmp is False], cache_hash
+        ))
+
+    methods = _compile_script("methods", attrs, "\n".join(scripts), globs)
+    for name, method_name in _METHOD_NAMES:
+        if name in methods:
+            setattr(cl, method_name, methods[name])
+    if apply_immutable is True:
+        _FREEZING_INITS.add(cl.__init__)
+    if apply_with_repr is True:
+        cl.__repr__ = _lazy_repr(
+            [a for a in attrs if a.exclude_from_repr is False]
+        )
+    if cache_hash is True:
+        cl.__getstate__ = _getstate_without_hash(
+            getattr(cl, "__getstate__", _default_getstate)
+        )
+    return cl
+
+
+def _default_getstate(self):
+    """
+    Return the state of *self* like :meth:`object.__getstate__` does on
+    Python 3.11 and later.
+    """
+    state = getattr(self, "__dict__", None) or None
+    slots = {}
+    for name in copyreg._slotnames(self.__class__):
+        if hasattr(self, name):
+            slots[name] = getattr(self, name)
+    if slots:
+        return state, slots
+    return state
+
+
+def _getstate_without_hash(getstate):
+    """
+    Return a ``__getstate__`` that removes the cached hash from the state that
+    *getstate* returns.
+
+    Hashes of strings differ between processes, therefore a cached hash must
+    never be restored.
+    """
+    def __getstate__(self):
+        """
+        Automatically created by characteristic.
+        """
+        state = getstate(self)
+        if isinstance(state, tuple) and len(state) == 2:
+            return tuple(_without_hash(s) for s in state)
+        return _without_hash(state)
+
+    return __getstate__
+
+
+def _without_hash(state):
+    """
+    Return *state* without a cached hash if it's a ``dict``.
+    """
+    if isinstance(state, dict) and "__characteristic_hash__" in state:
+        state = dict(state)
+        del state["__characteristic_hash__"]
+    return state
+
+
+# Names of generated functions and the methods they are added as.
+_METHOD_NAMES = [
+    ("characteristic_init", "__init__"),
+    ("characteristic_freezing_init", "__init__"),
+    ("characteristic_immutability_sentry", "__setattr__"),
+    ("__eq__", "__eq__"),
+    ("__ne__", "__ne__"),
+    ("__lt__", "__lt__"),
+    ("__le__", "__le__"),
+    ("__gt__", "__gt__"),
+    ("__ge__", "__ge__"),
+    ("__hash__", "__hash__"),
+]
+
+
+def _freeze_lines(init_name):
+    """
+    Return lines that call the original ``__init__`` and mark the instance as
+    frozen afterwards unless an outer initializer does that.
+
+    *init_name* is the name of the generated initializer.
+    """
+    return [
+        "if self.__class__.__init__ is {0}:".format(init_name),
+        "    _original_init(self, *args, **kw)",
+        '    _setattr(self, "__characteristic_frozen__", True)',
+        "else:",
+        "    _init_nested(self, _original_init, _setattr, args, kw)",
+    ]
+
+
+_FREEZING_INITS = weakref.WeakSet()
+"""
+Initializers of immutable classes that freeze the instances they initialize.
+"""
+
+
+def _init_nested(self, init, setattr_, args, kw):
+    """
+    Call the original initializer *init* of an immutable class for an instance
+    of one of its subclasses.
+
+    The instance is frozen afterwards only if *init* hasn't been called by the
+    initializer of another immutable class.
+    """
+    if self.__class__.__init__ in _FREEZING_INITS:
+        # The initializer of the subclass freezes the instance.
+        init(self, *args, **kw)
+        return
+
+    frozen = getattr(self, "__characteristic_frozen__", 0)
+    if frozen is True:
+        init(self, *args, **kw)
+        return
+    # Count the nested initializers of immutable classes using negative
+    # numbers so only the outermost one freezes the instance.
+    setattr_(self, "__characteristic_frozen__", frozen - 1)
+    init(self, *args, **kw)
+    setattr_(self, "__characteristic_frozen__", frozen or True)
+
+
+_FREEZING_INIT_SCRIPT = """\
+def characteristic_freezing_init(self, *args, **kw):
+    '''
+    Initializer automatically created by characteristic.
+
+    Calls the original `__init__` and marks the instance as frozen
+    afterwards.
+    '''
+    {freeze}
+""".format(freeze="\n    ".join(_freeze_lines("characteristic_freezing_init")))
+
+
+_SENTRY_SCRIPT = """\
+def characteristic_immutability_sentry(self, attr, value):
+    '''
+    Immutability sentry automatically created by characteristic.
+
+    If an attribute is attempted to be set after the initializer has
+    returned, an AttributeError is raised.  Else the original `__setattr__`
+    is called.
+    '''
+    if (
+        attr in _immutable_attrs
+        and getattr(self, "__characteristic_frozen__", False) is True
+    ):
+        raise AttributeError(
+            "Attribute '%s' of class '%s' is immutable."
+            % (attr, self.__class__.__name__)
+        )
+    _setattr(self, attr, value)
+"""
+
+
+def _compile_script(kind, attrs, script, globs):
+    """
+    Compile *script* that has been generated for *attrs*, execute it using
+    *globs* as globals, and return *globs*.
+    """
+    # We cache the generated methods for the same kinds of attributes.
+    sha1 = hashlib.sha1()
+    sha1.update(repr(attrs).encode("utf-8"))
+    sha1.update(script.encode("utf-8"))
+    unique_filename = "<characteristic generated {0} {1}>".format(
+        kind, sha1.hexdigest()
+    )
+
+    bytecode = compile(script, unique_filename, "exec")
+    exec(bytecode, globs)
+    # In order of debuggers like PDB being able to step through the code,
+    # we add a fake linecache entry.
+    linecache.cache[unique_filename] = (
+        len(script),
+        None,
+        script.splitlines(True),
+        unique_filename
+    )
+    return globs
+
+
+def _getattr_source(obj, attr):
+    """
+    Return the source of an expression that reads *attr* from *obj*.
+
+    Names that aren't valid identifiers are read using ``getattr``.
+    """
+    if attr.name.isidentifier() and not keyword.iskeyword(attr.name):
+        return obj + "." + attr.name
+    return "getattr({0}, {1!r})".format(obj, attr.name)
+
+
+def _tuple_source(items):
+    """
+    Return the source of a ``tuple`` literal of the expressions *items*.
+    """
+    if len(items) == 1:
+        return "({0},)".format(items[0])
+    return "({0})".format(", ".join(items))
+
+
+# Comparison methods and the operators they are implemented with.
+_CMP_OPS = [
+    ("__eq__", "=="),
+    ("__ne__", "!="),
+    ("__lt__", "<"),
+    ("__le__", "<="),
+    ("__gt__", ">"),
+    ("__ge__", ">="),
+]
+
+
+def _attrs_to_cmp_script(attrs, cache_hash=False):
+    """
+    Return a valid Python script of comparison methods and a hashing method
+    for *attrs*.
+
+    If *cache_hash* is `True`, the hashing method caches its result on frozen
+    instances.
+    """
+    self_tuple = _tuple_source([_getattr_source("self", a) for a in attrs])
+    other_tuple = _tuple_source([_getattr_source("other", a) for a in attrs])
+    methods = []
+    for name, op in _CMP_OPS:
+        methods.append("""\
+def {name}(self, other):
+    '''
+    Automatically created by characteristic.
+    '''
+    if other.__class__ is not self.__class__:
+        return NotImplemented
+    return {self_tuple} {op} {other_tuple}
+""".format(name=name, op=op, self_tuple=self_tuple, other_tuple=other_tuple))
+    if cache_hash is True:
+        methods.append("""\
+def __hash__(self):
+    '''
+    Automatically created by characteristic.
+    '''
+    h = getattr(self, "__characteristic_hash__", None)
+    if h is None:
+        h = hash({self_tuple})
+        if getattr(self, "__characteristic_frozen__", False) is True:
+            try:
+                _setattr(self, "__characteristic_hash__", h)
+            except AttributeError:
+                # The class uses __slots__ without room for the hash.
+                pass
+    return h
+""".format(self_tuple=self_tuple))
+    else:
+        methods.append("""\
+def __hash__(self):
+    '''
+    Automatically created by characteristic.
+    '''
+    return hash({self_tuple})
+""".format(self_tuple=self_tuple))
+
+    return "\n".join(methods)
+
+
+def _attrs_to_repr_script(attrs):
+    """
+    Return a valid Python script of a ``__repr__`` method for *attrs*.
+    """
+    return """\
+def __repr__(self):
+    '''
+    Automatically created by characteristic.
+    '''
+    return {template!r} % {values}
+""".format(
+        template="<%s({0})>".format(
+            ", ".join(a.name.replace("%", "%%") + "=%r" for a in attrs)
+        ),
+        values=_tuple_source(
+            ["self.__class__.__name__"] +
+            [_getattr_source("self", a) for a in attrs]
+        ),
+    )
+
+
+def _lazy_repr(attrs):
+    """
+    Return a ``__repr__`` that generates the actual method for *attrs* on its
+    first call and replaces itself with it on the class that owns it.
+
+    Most instances are never represented, so there's no need to pay for
+    generating the method when the class is created.
+    """
+    repr_ = None
+
+    def __repr__(self):
+        """
+        Automatically created by characteristic.
+        """
+        nonlocal repr_
+        if repr_ is None:
+            repr_ = _compile_script(
+                "repr", attrs, _attrs_to_repr_script(attrs), {}
+            )["__repr__"]
+        # The class may have been copied -- e.g. by ``use_slots`` -- after the
+        # placeholder has been added, so look for the one that owns it.
+        for cl in self.__class__.__mro__:
+            if cl.__dict__.get("__repr__") is __repr__:
+                cl.__repr__ = repr_
+                break
+        return repr_(self)
+
+    return __repr__
+
+
+def _attrs_to_script(attrs, bypass_setattr=False, fused=False,
+                     freeze=False):
     """
     Return a valid Python script of an initializer for *attrs*.
+
+    If *bypass_setattr* is `True`, the attributes are set by calling
+    ``_setattr`` instead of the class's ``__setattr__``.
+
+    If *fused* is `True`, the original ``__init__`` is called as
+    ``_original_init`` instead of looking it up as ``__original_init__`` on
+    the instance.  If *freeze* is `True` too, the instance is marked as frozen
+    afterwards.
     """
-    if all(a.default_value is NOTHING
-           and a.default_factory is None
-           and a.instance_of is None
-           for a in attrs) and not PY26:
-        # Simple version does not work with Python 2.6 because of
-        # http://bugs.python.org/issue10221
-        lines = _simple_init(attrs)
+    lines = _init_lines(attrs, bypass_setattr)
+
+    if fused is True:
+        if freeze is True:
+            lines += _freeze_lines("characteristic_init")
+        else:
+            lines.append("_original_init(self, *args, **kw)")
     else:
-        lines = _verbose_init(attrs)
+        lines.append("self.__original_init__(*args, **kw)")
 
     return """\
 def characteristic_init(self, *args, **kw):
     '''
     Attribute initializer automatically created by characteristic.
 
-    The original `__init__` method is renamed to `__original_init__` and
-    is called at the end with the initialized attributes removed from the
-    keyword arguments.
+    The original `__init__` method is called at the end with the initialized
+    attributes removed from the keyword arguments.
     '''
     {setters}
-    self.__original_init__(*args, **kw)
 """.format(setters="\n    ".join(lines))
 
 
-def _simple_init(attrs):
+def _attrs_to_globals(attrs):
     """
-    Create an init for *attrs* that doesn't care about defaults, default
-    factories, or argument validators.  This is a common case thus it's worth
-    optimizing for.
+    Return the globals for the initializer script of *attrs*.
+
+    Default values, default factories, and ``instance_of`` types are bound
+    directly so the initializer doesn't have to look them up on *attrs* on
+    each instantiation.
     """
-    lines = ["try:"]
-    for a in attrs:
-        lines.append("    self.{a.name} = kw.pop('{a._kw_name}')".format(a=a))
+    globs = {"_MISSING": _MISSING}
+    for i, a in enumerate(attrs):
+        globs["_default_{i}".format(i=i)] = a.default_value
+        globs["_factory_{i}".format(i=i)] = a.default_factory
+        globs["_type_{i}".format(i=i)] = a.instance_of
+    return globs
 
-    lines += [
-        # We include "pass" here in case attrs is empty.  Otherwise the "try"
-        # suite is empty.
-        "    pass",
-        "except KeyError as e:",
-        "     raise ValueError(\"Missing keyword value for "
-        "'%s'.\" % (e.args[0],))"
-    ]
-    return lines
 
+def _setter(attr, value, bypass_setattr):
+    """
+    Return a line that sets *attr* to the expression *value*.
+    """
+    if bypass_setattr is True:
+        return "_setattr(self, '{a.name}', {value})".format(
+            a=attr, value=value
+        )
+    else:
+        return "self.{a.name} = {value}".format(a=attr, value=value)
 
-def _verbose_init(attrs):
+
+def _init_lines(attrs, bypass_setattr):
     """
-    Create return a list of lines that initialize *attrs* while honoring
-    default values.
+    Return a list of lines that initialize *attrs* while honoring default
+    values, default factories, and argument validators.
     """
+    required = [(i, a)
+                for i, a in enumerate(attrs)
+                if a.default_value is NOTHING and a.default_factory is None]
     lines = []
+    if required:
+        # Popping all required keyword arguments within a single try saves a
+        # check per attribute in the common case of all of them being passed.
+        lines.append("try:")
+        for i, a in required:
+            lines.append(
+                "    v{i} = kw.pop('{a._kw_name}')".format(a=a, i=i)
+            )
+        lines += [
+            "except KeyError as e:",
+            "    raise ValueError(\"Missing keyword value for "
+            "'%s'.\" % (e.args[0],))"
+        ]
+
     for i, a in enumerate(attrs):
-        # attrs is passed into the the exec later to enable default_value
-        # and default_factory.  To find it, enumerate and 'i' are used.
-        lines.append(
-            "self.{a.name} = kw.pop('{a._kw_name}', {default})"
-            .format(
-                a=a,
-                # Save a lookup for the common case of no default value.
-                default="attrs[{i}].default_value".format(i=i)
-                if a.default_value is not NOTHING else "NOTHING"
+        # Default values, factories, and types are bound as globals by
+        # _attrs_to_globals.  To find them, enumerate and 'i' are used.
+        if a.default_value is not NOTHING:
+            lines.append(
+                "v{i} = kw.pop('{a._kw_name}', _default_{i})".format(a=a, i=i)
             )
-        )
-        if a.default_value is NOTHING:
-            lines.append("if self.{a.name} is NOTHING:".format(a=a))
-            if a.default_factory is None:
-                lines.append(
-                    "     raise ValueError(\"Missing keyword value for "
-                    "'{a._kw_name}'.\")".format(a=a),
-                )
-            else:
-                lines.append(
-                    "    self.{a.name} = attrs[{i}].default_factory()"
-                    .format(a=a, i=i)
-                )
-        if a.instance_of:
+        elif a.default_factory is not None:
+            # _MISSING is private so the user can't pass it by accident.
             lines.append(
-                "if not isinstance(self.{a.name}, attrs[{i}].instance_of):\n"
-                .format(a=a, i=i)
+                "v{i} = kw.pop('{a._kw_name}', _MISSING)".format(a=a, i=i)
             )
+            lines.append("if v{i} is _MISSING:".format(i=i))
+            lines.append("    v{i} = _factory_{i}()".format(i=i))
+        if a.instance_of:
+            lines.append("if not isinstance(v{i}, _type_{i}):".format(i=i))
             lines.append(
                 "    raise TypeError(\"Attribute '{a.name}' must be an"
                 " instance of '{type_name}'.\")"
                 .format(a=a, type_name=a.instance_of.__name__)
             )
+        lines.append(_setter(a, "v{i}".format(i=i), bypass_setattr))
 
     return lines
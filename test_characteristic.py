@@ -1,15 +1,16 @@
-from __future__ import absolute_import, division, print_function
-
+import copy
+import gc
 import linecache
+import pickle
 import sys
 import warnings
+import weakref
 
 import pytest
 
 from characteristic import (
     Attribute,
     NOTHING,
-    PY26,
     _attrs_to_script,
     _ensure_attributes,
     attributes,
@@ -19,8 +20,6 @@ from characteristic import (
     with_repr,
 )
 
-PY2 = sys.version_info[0] == 2
-
 warnings.simplefilter("always")
 
 
@@ -49,6 +48,14 @@ class TestAttribute(object):
         a = Attribute("foo", default_value="bar")
         assert "bar" == a.default_value
 
+    def test_interns_names(self):
+        """
+        The name and the keyword name are interned.
+        """
+        a = Attribute("".join(["_f", "oo"]))
+        assert sys.intern("_foo") is a.name
+        assert sys.intern("foo") is a._kw_name
+
     def test_ambiguous_defaults(self):
         """
         Instantiating with both default_value and default_factory raises
@@ -123,9 +130,9 @@ class TestAttribute(object):
             "<Attribute(name='name', exclude_from_cmp=True, "
             "exclude_from_init=True, exclude_from_repr=True, "
             "exclude_from_immutable=True, "
-            "default_value=42, default_factory=None, instance_of=<{0} 'str'>,"
-            " init_aliaser=None)>"
-        ).format("type" if PY2 else "class") == repr(a)
+            "default_value=42, default_factory=None, "
+            "instance_of=<class 'str'>, init_aliaser=None)>"
+        ) == repr(a)
 
     def test_eq_different_types(self):
         """
@@ -213,6 +220,12 @@ class TestWithCmp(object):
         """
         assert CmpC(*a) < CmpC(*b)
 
+    def test_ne_different_class(self):
+        """
+        __ne__ returns NotImplemented if classes differ.
+        """
+        assert NotImplemented == (CmpC(1, 2).__ne__(42))
+
     def test_lt_unordable(self):
         """
         __lt__ returns NotImplemented if classes differ.
@@ -280,6 +293,20 @@ class TestWithCmp(object):
         """
         assert NotImplemented == (CmpC(1, 2).__ge__(42))
 
+    def test_non_identifier_names(self):
+        """
+        Attributes whose names aren't identifiers are compared too.
+        """
+        @with_cmp(["foo-bar", "class"])
+        class C(object):
+            def __init__(self, a, b):
+                setattr(self, "foo-bar", a)
+                setattr(self, "class", b)
+
+        assert C(1, 2) == C(1, 2)
+        assert C(1, 2) < C(1, 3)
+        assert hash((1, 2)) == hash(C(1, 2))
+
     def test_hash(self):
         """
         __hash__ returns different hashes for different values.
@@ -298,6 +325,56 @@ class TestWithCmp(object):
 
         assert C(42, 1) == C(23, 1)
 
+    def test_single_attribute(self):
+        """
+        Classes with only one attribute are compared like 1-tuples.
+        """
+        @with_cmp(["a"])
+        class C(object):
+            def __init__(self, a):
+                self.a = a
+
+        assert C(1) == C(1)
+        assert C(1) < C(2)
+        assert hash((1,)) == hash(C(1))
+
+    def test_no_attributes(self):
+        """
+        Classes without attributes are compared like empty tuples.
+        """
+        @with_cmp([])
+        class C(object):
+            pass
+
+        assert C() == C()
+        assert hash(()) == hash(C())
+
+    def test_linecache(self):
+        """
+        The created methods are added to the linecache so PDB shows them
+        properly.
+        """
+        assert isinstance(
+            linecache.cache[CmpC.__eq__.__code__.co_filename], tuple
+        )
+
+    def test_many_attributes(self):
+        """
+        Classes with many attributes are compared like long tuples.
+        """
+        names = ["a", "b", "c", "d", "e", "f", "g", "h"]
+
+        @with_cmp(names)
+        class C(object):
+            def __init__(self, *values):
+                for name, value in zip(names, values):
+                    setattr(self, name, value)
+
+        values = tuple(range(len(names)))
+        assert C(*values) == C(*values)
+        assert C(*values) < C(*(values[:-1] + (42,)))
+        assert hash(values) == hash(C(*values))
+
 
 @with_repr(["a", "b"])
 class ReprC(object):
@@ -325,6 +402,88 @@ class TestReprAttrs(object):
 
         assert "<C(b=2)>" == repr(C(1, 2))
 
+    def test_lazy(self):
+        """
+        The method is generated on the first call and replaces the
+        placeholder on the class.
+        """
+        @with_repr(["a"])
+        class C(object):
+            def __init__(self, a):
+                self.a = a
+
+        placeholder = C.__dict__["__repr__"]
+        assert "<C(a=1)>" == repr(C(1))
+        assert placeholder is not C.__dict__["__repr__"]
+        assert isinstance(
+            linecache.cache[C.__repr__.__code__.co_filename], tuple
+        )
+        assert "<C(a=2)>" == repr(C(2))
+
+    def test_lazy_subclass(self):
+        """
+        Calling the placeholder on a subclass replaces it on the decorated
+        class and uses the subclass's name.
+        """
+        @with_repr(["a"])
+        class C(object):
+            def __init__(self, a):
+                self.a = a
+
+        class D(C):
+            pass
+
+        assert "<D(a=1)>" == repr(D(1))
+        assert "__repr__" not in D.__dict__
+        assert "<C(a=1)>" == repr(C(1))
+
+    def test_lazy_copied_class(self):
+        """
+        If the class has been copied after adding the placeholder, the method
+        replaces the placeholder on the copy.
+        """
+        @attributes(["a"], apply_with_repr=False, use_slots=True)
+        @with_repr(["a"])
+        class C(object):
+            pass
+
+        placeholder = C.__dict__["__repr__"]
+        assert "<C(a=1)>" == repr(C(a=1))
+        repr_ = C.__dict__["__repr__"]
+        assert placeholder is not repr_
+        assert "<C(a=2)>" == repr(C(a=2))
+        assert repr_ is C.__dict__["__repr__"]
+
+    def test_non_identifier_names(self):
+        """
+        Attributes whose names aren't identifiers are represented too.
+        """
+        @with_repr(["foo-bar", "class", "%s"])
+        class C(object):
+            pass
+
+        obj = C()
+        setattr(obj, "foo-bar", 1)
+        setattr(obj, "class", 2)
+        setattr(obj, "%s", 3)
+        assert "<C(foo-bar=1, class=2, %s=3)>" == repr(obj)
+
+    def test_tuple_values(self):
+        """
+        Values that are tuples are represented like any other value.
+        """
+        assert "<ReprC(a=(1, 2), b=())>" == repr(ReprC((1, 2), ()))
+
+    def test_no_attributes(self):
+        """
+        Classes without attributes have an empty repr.
+        """
+        @with_repr([])
+        class C(object):
+            pass
+
+        assert "<C()>" == repr(C())
+
 
 @with_init([Attribute("a"), Attribute("b")])
 class InitC(object):
@@ -398,6 +557,19 @@ class TestWithInit(object):
         obj = InitWithDefaults(a=1)
         assert 2 == obj.b
 
+    def test_missing_arg_with_defaults(self):
+        """
+        Raises `ValueError` if a required value isn't passed while optional
+        ones are defined too.
+        """
+        @with_init(["a", Attribute("b", default_value=2), "c"])
+        class C(object):
+            pass
+        with pytest.raises(ValueError) as e:
+            C(a=1)
+        assert "Missing keyword value for 'c'." == e.value.args[0]
+        assert 2 == C(a=1, c=3).b
+
     def test_missing_arg(self):
         """
         Raises `ValueError` if a value isn't passed.
@@ -443,6 +615,16 @@ class TestWithInit(object):
         o2 = C()
         assert o1.a is not o2.a
 
+    def test_nothing_is_a_value(self):
+        """
+        Explicitly passing NOTHING sets the attribute to it instead of falling
+        back to the default factory.
+        """
+        @with_init([Attribute("a", default_factory=list)])
+        class C(object):
+            pass
+        assert NOTHING is C(a=NOTHING).a
+
     def test_underscores(self):
         """
         with_init takes keyword aliasing into account.
@@ -575,6 +757,32 @@ class TestWithInit(object):
         C()
 
 
+@attributes(["a"], apply_immutable=True)
+class PickleC(object):
+    pass
+
+
+@attributes(["a"], apply_immutable=True, use_slots=True)
+class SlottedPickleC(object):
+    pass
+
+
+class GetStateBase(object):
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["custom"] = True
+        return state
+
+    def __setstate__(self, state):
+        state.pop("custom")
+        self.__dict__.update(state)
+
+
+@attributes(["a"], apply_immutable=True)
+class GetStateC(GetStateBase):
+    pass
+
+
 class TestAttributes(object):
     def test_leaves_init_alone(self):
         """
@@ -620,6 +828,37 @@ class TestAttributes(object):
         with pytest.raises(AttributeError):
             obj.a = "23"
 
+    def test_single_script(self):
+        """
+        All methods are created by the same script and the original
+        __init__ and __setattr__ aren't stored on the class.
+        """
+        @attributes(["a"], apply_immutable=True)
+        class C(object):
+            pass
+
+        filename = C.__init__.__code__.co_filename
+        assert isinstance(linecache.cache[filename], tuple)
+        for name in ("__setattr__", "__eq__", "__hash__"):
+            assert filename == getattr(C, name).__code__.co_filename
+        assert "__original_init__" not in C.__dict__
+        assert "__original_setattr__" not in C.__dict__
+
+    def test_immutable_without_init(self):
+        """
+        If only *apply_immutable* is `True`, instances are frozen after the
+        original __init__ returns.
+        """
+        @attributes(["a"], apply_with_init=False, apply_immutable=True)
+        class C(object):
+            def __init__(self, a):
+                self.a = a
+
+        obj = C(42)
+        assert 42 == obj.a
+        with pytest.raises(AttributeError):
+            obj.a = 23
+
     def test_apply_with_cmp(self):
         """
         Don't add cmp methods if *apply_with_cmp* is `False`.
@@ -628,11 +867,7 @@ class TestAttributes(object):
         class C(object):
             pass
 
-        obj = C(a=1)
-        if PY2:
-            assert None is getattr(obj, "__eq__", None)
-        else:
-            assert object.__eq__ == C.__eq__
+        assert object.__eq__ == C.__eq__
 
     def test_apply_with_repr(self):
         """
@@ -752,6 +987,240 @@ class TestAttributes(object):
             pass
         C()
 
+    def test_use_slots(self):
+        """
+        If *use_slots* is `True`, the attributes are stored in __slots__.
+        """
+        @attributes(["a", "b"], use_slots=True)
+        class C(object):
+            pass
+
+        obj = C(a=1, b=2)
+        assert ("a", "b", "__weakref__") == C.__slots__
+        assert not hasattr(obj, "__dict__")
+        assert "<C(a=1, b=2)>" == repr(obj)
+        assert C(a=1, b=2) == obj
+        with pytest.raises(AttributeError):
+            obj.c = 3
+
+    def test_use_slots_weakref(self):
+        """
+        Slotted instances support weak references.
+        """
+        @attributes(["a"], use_slots=True)
+        class C(object):
+            pass
+
+        obj = C(a=1)
+        assert obj is weakref.ref(obj)()
+
+    def test_use_slots_weakref_base(self):
+        """
+        If a base class supports weak references already, no __weakref__ slot
+        is added.
+        """
+        class Base(object):
+            __slots__ = ("__weakref__",)
+
+        @attributes(["a"], use_slots=True)
+        class C(Base):
+            pass
+
+        obj = C(a=1)
+        assert ("a",) == C.__slots__
+        assert obj is weakref.ref(obj)()
+
+    def test_use_slots_already_slotted(self):
+        """
+        Names that are slotted already by the class or its bases are skipped.
+        """
+        class Base(object):
+            __slots__ = ("a",)
+
+        @attributes(["a", "b", "c"], use_slots=True)
+        class C(Base):
+            __slots__ = ("b",)
+
+        obj = C(a=1, b=2, c=3)
+        assert ("b", "c", "__weakref__") == C.__slots__
+        assert "<C(a=1, b=2, c=3)>" == repr(obj)
+        assert not hasattr(obj, "__dict__")
+
+    def test_use_slots_class_variable(self):
+        """
+        Class variables that are named like attributes are removed.
+        """
+        @attributes(["a"], use_slots=True)
+        class C(object):
+            a = 5
+
+        assert ("a", "__weakref__") == C.__slots__
+        assert 1 == C(a=1).a
+
+    def test_use_slots_private(self):
+        """
+        Private attributes can't be slotted.
+        """
+        with pytest.raises(ValueError) as e:
+            @attributes([Attribute("__p")], use_slots=True)
+            class C(object):
+                pass
+
+        assert (
+            "Private attribute '__p' can't be stored in __slots__ because its "
+            "name would be mangled."
+        ) == e.value.args[0]
+
+    def test_use_slots_own_private_slot(self):
+        """
+        Private slots of the class itself are kept.
+        """
+        @attributes(["a"], use_slots=True)
+        class C(object):
+            __slots__ = ("__p",)
+
+            def set_p(self, value):
+                self.__p = value
+
+            def get_p(self):
+                return self.__p
+
+        obj = C(a=1)
+        obj.set_p(2)
+        assert 2 == obj.get_p()
+
+    def test_use_slots_keeps_class_body(self):
+        """
+        Methods, the module, and the docstring of the class survive.
+        """
+        @attributes(["a"], use_slots=True)
+        class C(object):
+            """
+            Docstring.
+            """
+            def method(self):
+                return self.a
+
+        assert 42 == C(a=42).method()
+        assert "Docstring." == C.__doc__.strip()
+        assert __name__ == C.__module__
+        assert [Attribute("a")] == C.characteristic_attributes
+
+    def test_use_slots_immutable(self):
+        """
+        Slotted classes can be immutable.
+        """
+        @attributes(["a"], apply_immutable=True, use_slots=True)
+        class C(object):
+            pass
+
+        obj = C(a=42)
+        with pytest.raises(AttributeError):
+            obj.a = 23
+
+    def test_immutable_caches_hash(self):
+        """
+        If all compared attributes are immutable, the hash is computed only
+        once.
+        """
+        @attributes(["a"], apply_immutable=True)
+        class C(object):
+            pass
+
+        obj = C(a=42)
+        assert hash((42,)) == hash(obj)
+        assert hash((42,)) == obj.__characteristic_hash__
+        object.__setattr__(obj, "a", 23)
+        assert hash((42,)) == hash(obj)
+
+    def test_mutable_does_not_cache_hash(self):
+        """
+        If any of the compared attributes is mutable, the hash is computed on
+        each call.
+        """
+        @attributes(["a", Attribute("b", exclude_from_immutable=True)],
+                    apply_immutable=True)
+        class C(object):
+            pass
+
+        obj = C(a=1, b=2)
+        assert hash((1, 2)) == hash(obj)
+        obj.b = 3
+        assert hash((1, 3)) == hash(obj)
+        assert not hasattr(obj, "__characteristic_hash__")
+
+    def test_use_slots_caches_hash(self):
+        """
+        Slotted immutable classes have room for the cached hash.
+        """
+        @attributes(["a"], apply_immutable=True, use_slots=True)
+        class C(object):
+            pass
+
+        obj = C(a=42)
+        assert hash((42,)) == hash(obj)
+        assert hash((42,)) == obj.__characteristic_hash__
+
+    def test_inherited_getstate(self):
+        """
+        An inherited __getstate__ is still used, only the cached hash is
+        removed from its state.
+        """
+        obj = GetStateC(a="42")
+        object.__setattr__(obj, "__characteristic_hash__", 23)
+
+        other = pickle.loads(pickle.dumps(obj))
+
+        assert obj == other
+        assert not hasattr(other, "__characteristic_hash__")
+        assert hash(("42",)) == hash(other)
+
+    def test_no_cmp_no_hash_caching(self):
+        """
+        Without with_cmp, there's no hash to cache.
+        """
+        @attributes(["a"], apply_with_cmp=False, apply_immutable=True,
+                    use_slots=True)
+        class C(object):
+            pass
+
+        assert "__characteristic_hash__" not in C.__slots__
+        assert "__getstate__" not in C.__dict__
+
+    def test_own_slots_without_hash(self):
+        """
+        If the class has its own __slots__ without room for the cached hash,
+        the hash is computed on each call.
+        """
+        @attributes(["a"], apply_immutable=True)
+        class C(object):
+            __slots__ = ("a", "__characteristic_frozen__")
+
+        obj = C(a=42)
+        assert hash((42,)) == hash(obj)
+        assert hash((42,)) == hash(obj)
+        assert not hasattr(obj, "__characteristic_hash__")
+
+    @pytest.mark.parametrize("use_slots", [False, True])
+    def test_cached_hash_not_pickled(self, use_slots):
+        """
+        Cached hashes are neither pickled nor copied because hashes of strings
+        differ between processes.
+        """
+        obj = PickleC(a="42")
+        if use_slots is True:
+            obj = SlottedPickleC(a="42")
+        # Pretend the hash has been cached by a different process.
+        object.__setattr__(obj, "__characteristic_hash__", 23)
+
+        for other in (pickle.loads(pickle.dumps(obj)), copy.copy(obj),
+                      copy.deepcopy(obj)):
+            assert obj == other
+            assert not hasattr(other, "__characteristic_hash__")
+            assert hash(("42",)) == hash(other)
+            with pytest.raises(AttributeError):
+                other.a = "23"
+
 
 class TestEnsureAttributes(object):
     def test_leaves_attribute_alone(self):
@@ -761,6 +1230,16 @@ class TestEnsureAttributes(object):
         a = Attribute("a")
         assert a is _ensure_attributes([a], {})[0]
 
+    def test_leaves_attribute_subclass_alone(self):
+        """
+        List items that are instances of Attribute subclasses stay untouched.
+        """
+        class SubAttribute(Attribute):
+            __slots__ = []
+
+        a = SubAttribute("a")
+        assert a is _ensure_attributes([a], {})[0]
+
     def test_converts_rest(self):
         """
         Any other item will be transformed into an Attribute.
@@ -769,6 +1248,36 @@ class TestEnsureAttributes(object):
         assert isinstance(l[0], Attribute)
         assert "a" == l[0].name
 
+    def test_shares_plain_attributes(self):
+        """
+        Attributes for plain names are shared.
+        """
+        assert (
+            _ensure_attributes(["a"], NOTHING)[0]
+            is _ensure_attributes(["a"], NOTHING)[0]
+        )
+
+    def test_forgets_unused_plain_attributes(self):
+        """
+        Shared attributes that aren't used anymore are dropped.
+        """
+        attr = _ensure_attributes(["unused_plain_attribute"], NOTHING)[0]
+        ref = weakref.ref(attr)
+        del attr
+        gc.collect()
+
+        assert ref() is None
+
+    def test_does_not_share_defaults(self):
+        """
+        Attributes with legacy defaults aren't shared.
+        """
+        a1 = _ensure_attributes(["a"], {"a": []})[0]
+        a2 = _ensure_attributes(["a"], {"a": []})[0]
+        assert a1 is not a2
+        assert a1.default_value is not a2.default_value
+        assert a1 is not _ensure_attributes(["a"], NOTHING)[0]
+
     def test_defaults(self):
         """
         Legacy defaults are translated into default_value attributes.
@@ -835,6 +1344,24 @@ class TestImmutable(object):
         i = ImmuClass(foo="qux")
         assert "qux" == i.foo
 
+    def test_with_init_bypasses_sentry(self):
+        """
+        with_init's initializer sets the attributes using the original
+        __setattr__ if immutable has been applied before.
+        """
+        @with_init(["foo"])
+        @immutable(["foo"])
+        class ImmuClass(object):
+            pass
+
+        i = ImmuClass(foo="qux")
+        assert "qux" == i.foo
+        assert "_setattr(self, 'foo'" in "".join(linecache.getlines(
+            ImmuClass.__init__.__code__.co_filename
+        ))
+        with pytest.raises(AttributeError):
+            i.foo = "not qux"
+
     def test_Attribute_exclude_from_immutable(self):
         """
         Ignores attribute if exclude_from_immutable=True.
@@ -850,17 +1377,174 @@ class TestImmutable(object):
         with pytest.raises(AttributeError):
             c.b = 4
 
+    def test_methods_called_by_init(self):
+        """
+        Changes from methods that are called by __init__ are allowed.
+        """
+        @immutable(["foo"])
+        class ImmuClass(object):
+            def __init__(self):
+                self._set_foo()
+
+            def _set_foo(self):
+                self.foo = "bar"
+
+        i = ImmuClass()
+        assert "bar" == i.foo
+        with pytest.raises(AttributeError):
+            i._set_foo()
+
+    def test_caller_name_irrelevant(self):
+        """
+        Functions that are called like initializers can't change frozen
+        instances.
+        """
+        @immutable(["foo"])
+        class ImmuClass(object):
+            def __init__(self):
+                self.foo = "bar"
+
+        def __init__(obj):
+            obj.foo = "not bar"
+
+        i = ImmuClass()
+        with pytest.raises(AttributeError):
+            __init__(i)
+
+    def test_immutable_subclass(self):
+        """
+        Immutable subclasses can set attributes after calling the initializer
+        of their immutable base class and are frozen afterwards.
+        """
+        @immutable(["a"])
+        class Base(object):
+            def __init__(self):
+                self.a = 1
+
+        @immutable(["b"])
+        class Sub(Base):
+            def __init__(self):
+                super().__init__()
+                self.b = 2
+
+        i = Sub()
+        assert (1, 2) == (i.a, i.b)
+        with pytest.raises(AttributeError):
+            i.a = 3
+        with pytest.raises(AttributeError):
+            i.b = 3
+
+    def test_attributes_subclass(self):
+        """
+        The same holds for classes decorated by attributes.
+        """
+        @attributes(["a"], apply_immutable=True)
+        class Base(object):
+            pass
+
+        @attributes(["b"], apply_immutable=True)
+        class Sub(Base):
+            def __init__(self, **kw):
+                super().__init__(a=1)
+                self.a = 2
+
+        i = Sub(b=3)
+        assert (2, 3) == (i.a, i.b)
+        with pytest.raises(AttributeError):
+            i.b = 4
+
+    def test_plain_subclass(self):
+        """
+        If a plain subclass calls nested initializers of immutable classes,
+        the instance is frozen by the outermost one.
+        """
+        @immutable(["a"])
+        class Base(object):
+            def __init__(self):
+                self.a = 1
+
+        @immutable(["b"])
+        class Middle(Base):
+            def __init__(self):
+                super().__init__()
+                self.b = 2
+
+        class Sub(Middle):
+            def __init__(self):
+                super().__init__()
+                self.c = 3
+
+        i = Sub()
+        assert (1, 2, 3) == (i.a, i.b, i.c)
+        assert i.__characteristic_frozen__ is True
+        with pytest.raises(AttributeError):
+            i.b = 4
+
+    def test_slots(self):
+        """
+        Classes with __slots__ work if they include the frozen marker.
+        """
+        @immutable(["foo"])
+        class ImmuClass(object):
+            __slots__ = ("foo", "__characteristic_frozen__")
+
+            def __init__(self):
+                self.foo = "bar"
+
+        i = ImmuClass()
+        assert "bar" == i.foo
+        with pytest.raises(AttributeError):
+            i.foo = "not bar"
+
 
 class TestAttrsToScript(object):
-    @pytest.mark.skipif(PY26, reason="Optimization works only on Python 2.7.")
     def test_optimizes_simple(self):
         """
         If no defaults and extra checks are passed, an optimized version is
-        used on Python 2.7+.
+        used.
         """
         attrs = [Attribute("a")]
         script = _attrs_to_script(attrs)
         assert "except KeyError as e:" in script
+        assert "self.a = v0" in script
+
+    def test_pops_required_at_once(self):
+        """
+        Required attributes are popped within a single try even if there
+        are optional ones.
+        """
+        attrs = [Attribute("a"), Attribute("b", default_value=42),
+                 Attribute("c")]
+        script = _attrs_to_script(attrs)
+        assert 1 == script.count("except KeyError as e:")
+        assert "_MISSING" not in script
+        assert "    v0 = kw.pop('a')\n        v2 = kw.pop('c')\n" in script
+
+    def test_bypass_setattr(self):
+        """
+        If bypass_setattr is True, attributes are set using _setattr.
+        """
+        attrs = [Attribute("a"), Attribute("b", default_value=42)]
+        for script in (_attrs_to_script(attrs[:1], bypass_setattr=True),
+                       _attrs_to_script(attrs, bypass_setattr=True)):
+            assert "_setattr(self, 'a'," in script
+            assert "self.a =" not in script
+
+    def test_binds_defaults(self):
+        """
+        Default values, factories, and types are referenced directly instead
+        of being looked up on the attributes on each instantiation.
+        """
+        attrs = [
+            Attribute("a", default_value=42),
+            Attribute("b", default_factory=list),
+            Attribute("c", instance_of=int),
+        ]
+        script = _attrs_to_script(attrs)
+        assert "attrs[" not in script
+        assert "kw.pop('a', _default_0)" in script
+        assert "_factory_1()" in script
+        assert "_type_2" in script
 
 
 def test_nothing():